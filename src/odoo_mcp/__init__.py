@@ -2,6 +2,6 @@
 Odoo MCP Server - MCP Server for Odoo Integration
 """
 
-from .server import mcp
+from .server import SearchReadArgs, mcp
 
-__all__ = ["mcp"]
+__all__ = ["mcp", "SearchReadArgs"]
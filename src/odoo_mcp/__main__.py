@@ -5,14 +5,56 @@ import sys
 import os
 import logging
 import uvicorn
-from importlib import import_module
 from starlette.applications import Starlette
 from starlette.routing import Host, Mount
 
 from .server import mcp
+from .uvicorn_config import UVICORN_CONFIG
 
 _logger = logging.getLogger(__name__)
 
+
+def _log_environment() -> None:
+    """
+    Log the Python version and the ODOO_* environment, hiding the password
+    """
+    _logger.info(f"Python version: {sys.version}")
+    odoo_env = {
+        key: "***hidden***" if key == "ODOO_PASSWORD" else value
+        for key, value in os.environ.items()
+        if key.startswith("ODOO_")
+    }
+    _logger.info("Odoo environment variables: %s", odoo_env)
+
+
+def _build_app() -> Starlette:
+    """
+    Build the ASGI app for the transport selected by ODOO_MCP_TRANSPORT
+
+    "sse" (default) serves the FastMCP SSE app, "http" serves the
+    streamable HTTP app, which answers each request without keeping a
+    long-lived event stream open.
+    """
+    transport = os.environ.get("ODOO_MCP_TRANSPORT", "sse").lower()
+    if transport == "http":
+        # Served as is: its lifespan runs the streamable HTTP session manager
+        return mcp.streamable_http_app()
+    if transport != "sse":
+        raise ValueError(
+            f"Invalid ODOO_MCP_TRANSPORT: {transport!r}, expected 'sse' or 'http'"
+        )
+
+    # Build the FastMCP SSE app once and serve it on both routes so they
+    # share a single session store
+    sse_app = mcp.sse_app()
+    return Starlette(
+        routes=[
+            Mount('/', app=sse_app),
+            Host('mcp.acme.corp', app=sse_app)
+        ]
+    )
+
+
 def main() -> int:
     """
     Run the MCP server
@@ -20,29 +62,14 @@ def main() -> int:
     try:
         # Print startup information
         _logger.info("=== ODOO MCP SERVER STARTING ===")
-        _logger.info(f"Python version: {sys.version}")
-        _logger.info("Environment variables:")
-        for key, value in os.environ.items():
-            if key.startswith("ODOO_"):
-                if key == "ODOO_PASSWORD":
-                    _logger.info(f"  {key}: ***hidden***")
-                else:
-                    _logger.info(f"  {key}: {value}")
-        
+        _log_environment()
         _logger.info(f"MCP object type: {type(mcp)}")
-        
+
         # Run server in HTTP mode
         _logger.info("Starting Odoo MCP server with HTTP transport...")
-        
-        # Create a Starlette app and mount the FastMCP SSE app
-        app = Starlette(
-            routes=[
-                Mount('/', app=mcp.sse_app()),
-                Host('mcp.acme.corp', app=mcp.sse_app())
-            ]
-        )
-        
-        uvicorn.run(app, host='0.0.0.0', port=8000)
+        app = _build_app()
+
+        uvicorn.run(app, **UVICORN_CONFIG)
         _logger.info("MCP server stopped normally")
         return 0
     except Exception as e:
@@ -0,0 +1,103 @@
+"""
+On-disk cache of Odoo model metadata
+
+Keeps the model list and field definitions as JSON files so they survive
+restarts and can still be served while Odoo is unreachable.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+import orjson
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("~/.cache/odoo-mcp").expanduser()
+
+
+class DiskCache:
+    """Stale-while-revalidate JSON file cache, scoped to one Odoo database"""
+
+    def __init__(
+        self,
+        url: str,
+        db: str,
+        directory: Union[str, Path] = DEFAULT_CACHE_DIR,
+        ttl: float = 86400,
+    ) -> None:
+        """
+        Initialize the cache
+
+        Args:
+            url: Odoo server URL, used to keep instances apart
+            db: Database name, used to keep databases apart
+            directory: Root directory of the cache
+            ttl: Number of seconds after which an entry is considered stale
+        """
+        instance = hashlib.sha1(f"{url}|{db}".encode()).hexdigest()[:16]
+        self.directory = Path(directory) / instance
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        """
+        Return the file of a key such as 'models' or 'fields/res.partner'
+
+        Keys contain model names sent by clients, so they are hashed rather
+        than used as path components: no key can point outside the cache.
+        """
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def read(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Read an entry
+
+        Returns:
+            Tuple (value, fresh): value is None when there is no readable
+            entry, fresh tells whether it is younger than the TTL
+        """
+        path = self._path(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+            value = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None, False
+        except (OSError, orjson.JSONDecodeError) as e:
+            _logger.info(f"Ignoring unreadable cache file {path}: {str(e)}")
+            return None, False
+        return value, age < self.ttl
+
+    def write(self, key: str, value: Any) -> None:
+        """Write an entry atomically so readers never see a partial file"""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            # The cache is an optimization, never fail a request because of it
+            _logger.info(f"Could not write cache file {path}: {str(e)}")
+
+    def clear(self) -> int:
+        """Delete every entry of this database, returning how many were removed"""
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                _logger.info(f"Could not delete cache file {path}: {str(e)}")
+        return removed
@@ -2,19 +2,295 @@
 Odoo XML-RPC client for MCP server integration
 """
 
+import asyncio
+import collections
+import copy
+import functools
 import json
 import os
 import re
 import socket
 import logging
+import threading
+import time
 import urllib.parse
 
 import http.client
 import xmlrpc.client
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+import httpx
+
+from .disk_cache import DiskCache
 
 
 _logger = logging.getLogger(__name__)
 
+# Logical operators between domain conditions, and comparison operators
+# inside them (Odoo's DOMAIN_OPERATORS and TERM_OPERATORS)
+_DOMAIN_LOGIC_OPERATORS = ("&", "|", "!")
+_DOMAIN_TERM_OPERATORS = frozenset(
+    (
+        "=", "!=", "<>", ">", ">=", "<", "<=", "=?", "=like", "=ilike",
+        "like", "not like", "ilike", "not ilike", "in", "not in",
+        "child_of", "parent_of", "any", "not any",
+    )
+)
+
+# Operators comparing to record IDs, where "42" can safely be sent as 42
+_ID_OPERATORS = frozenset(("=", "!=", "in", "not in", "child_of", "parent_of"))
+
+# Field types holding integers or record IDs. Names are no guide: Char
+# fields such as hr.employee's identification_id also end in "_id".
+_ID_FIELD_TYPES = frozenset(("integer", "many2one", "one2many", "many2many"))
+
+# Odoo's constant leaves, always true and always false
+_DOMAIN_CONSTANT_LEAVES = ((1, "="), (0, "="))
+
+# Pattern operators whose comma separated values can be turned into "in"
+_COMMA_TO_IN_OPERATORS = frozenset(("like", "ilike"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _domain_shape(shape: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """
+    Validate and normalize the shape of a domain
+
+    The shape is the domain without its values: a tuple of logical
+    operators and (field, operator) pairs. LLMs mostly resend the same
+    shapes with different values, so each shape is only checked once.
+
+    Returns:
+        Tuple of logical operators and (field, operator, compares_ids)
+        triples, compares_ids telling whether the operator is in _ID_OPERATORS
+    """
+    prepared = []
+    for element in shape:
+        if element in _DOMAIN_LOGIC_OPERATORS:
+            prepared.append(element)
+            continue
+        if isinstance(element, str):
+            raise ValueError(f"Invalid domain element: {element!r}")
+        if element in _DOMAIN_CONSTANT_LEAVES:
+            prepared.append((element[0], element[1], False))
+            continue
+
+        field, operator = element
+        if not isinstance(field, str) or not isinstance(operator, str):
+            raise ValueError(f"Invalid domain condition: {element!r}")
+        field = field.strip()
+        operator = operator.strip().lower()
+        if operator not in _DOMAIN_TERM_OPERATORS:
+            raise ValueError(f"Unsupported domain operator: {operator!r}")
+
+        prepared.append((field, operator, operator in _ID_OPERATORS))
+    return tuple(prepared)
+
+
+def _coerce_id(value: Any) -> Any:
+    """Convert numeric strings, alone or in a list, to integer IDs"""
+    if isinstance(value, str):
+        # isdigit() would also accept characters such as "²" that int() rejects
+        return int(value) if value.isdecimal() else value
+    if isinstance(value, (list, tuple)):
+        return [_coerce_id(item) for item in value]
+    return value
+
+
+def prepare_domain(
+    domain: Sequence[Any],
+    comma_to_in: bool = False,
+    field_types: Optional[Mapping[str, Optional[str]]] = None,
+) -> List[Any]:
+    """
+    Validate a search domain and normalize it before sending it to Odoo
+
+    This is the single place domains are validated. Besides checking the
+    structure and operators, it accepts a bare condition such as
+    ["name", "=", "test"] and tuples instead of lists, strips whitespace
+    around field names and operators, lowercases operators and turns
+    numeric strings into integers when comparing IDs
+    (e.g. ["partner_id", "=", "7"]): always for the "id" field, and for the
+    fields that field_types lists as integer or relational.
+
+    Args:
+        domain: List of conditions [field, operator, value] and logical
+            operators ('&', '|', '!'), or a single condition
+        comma_to_in: Rewrite like/ilike conditions on comma separated values
+            into "in", e.g. ["ref", "ilike", "A1,B2"] into
+            ["ref", "in", ["A1", "B2"]]. Odoo can then use an index
+            instead of scanning, but the values must match exactly.
+        field_types: Mapping of the model's field names to their Odoo
+            types, None if they are not known
+
+    Returns:
+        The normalized domain as a new list
+
+    Raises:
+        ValueError: If an element is malformed or an operator is unknown
+    """
+    if not isinstance(domain, (list, tuple)):
+        raise ValueError("domain must be a list of conditions")
+    if len(domain) == 3 and isinstance(domain[0], str) and (
+        domain[0] not in _DOMAIN_LOGIC_OPERATORS
+    ):
+        domain = [domain]
+
+    shape: List[Any] = []
+    for element in domain:
+        if isinstance(element, (list, tuple)) and len(element) == 3:
+            shape.append((element[0], element[1]))
+        elif isinstance(element, str):
+            shape.append(element)
+        else:
+            raise ValueError(f"Invalid domain element: {element!r}")
+
+    try:
+        prepared_shape = _domain_shape(tuple(shape))
+    except TypeError:
+        # Unhashable field name or operator, e.g. a nested list
+        raise ValueError(f"Invalid domain: {domain!r}")
+
+    prepared: List[Any] = []
+    for element, normalized in zip(domain, prepared_shape):
+        if isinstance(normalized, str):
+            prepared.append(normalized)
+            continue
+        field, operator, compares_ids = normalized
+        value = element[2]
+        if compares_ids and (
+            field == "id"
+            or (field_types is not None and field_types.get(field) in _ID_FIELD_TYPES)
+        ):
+            value = _coerce_id(value)
+        if (
+            comma_to_in
+            and operator in _COMMA_TO_IN_OPERATORS
+            and isinstance(value, str)
+            and "," in value
+        ):
+            operator = "in"
+            value = [part.strip() for part in value.split(",") if part.strip()]
+        prepared.append([field, operator, value])
+    return prepared
+
+
+# Field attributes requested from fields_get; Odoo returns 20+ per field
+# otherwise (domains, contexts, depends...), which agents never use
+_FIELD_ATTRIBUTES = [
+    "type", "string", "help", "required", "readonly", "selection", "relation",
+    "store",
+]
+
+
+# A call of multicall(): (model, method, args, kwargs)
+_Call = Tuple[str, str, List[Any], Dict[str, Any]]
+
+
+def _model_info_calls(model_name: str) -> List[_Call]:
+    """Build the multicall entries fetching a model's ir.model row and fields"""
+    return [
+        (
+            "ir.model",
+            "search_read",
+            [[("model", "=", model_name)]],
+            {"fields": ["name", "model"]},
+        ),
+        (model_name, "fields_get", [], {"attributes": _FIELD_ATTRIBUTES}),
+    ]
+
+
+def _field_types(fields: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """Map the field names of a fields_get result to their types"""
+    return {name: field.get("type") for name, field in fields.items()}
+
+
+def _merge_model_info(
+    model_name: str, info_result: Any, fields_result: Any
+) -> Dict[str, Any]:
+    """
+    Combine the outcomes of the calls built by _model_info_calls into one
+    dictionary, keeping the error shapes of get_model_info/get_model_fields
+    """
+    model_info: Dict[str, Any]
+    if isinstance(info_result, Exception):
+        _logger.info(f"Error retrieving model info: {str(info_result)}")
+        model_info = {"error": str(info_result)}
+    elif info_result:
+        model_info = info_result[0]
+    else:
+        model_info = {"error": f"Model {model_name} not found"}
+
+    if isinstance(fields_result, Exception):
+        _logger.info(f"Error retrieving fields: {str(fields_result)}")
+        model_info["fields"] = {"error": str(fields_result)}
+    else:
+        model_info["fields"] = fields_result
+    return model_info
+
+
+class MetadataCache:
+    """Size-bounded LRU cache with expiry for Odoo model metadata"""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300) -> None:
+        """
+        Initialize the cache
+
+        Args:
+            maxsize: Maximum number of entries, least recently used are evicted
+            ttl: Number of seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: collections.OrderedDict[Hashable, Tuple[float, Any]] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return a copy of the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Callers mutate the result (e.g. add "fields"), never hand out the original
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a copy of the value under the key"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        """Drop all entries and return how many there were"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        return count
+
+
 class OdooClient:
     """Client for interacting with Odoo via XML-RPC"""
 
@@ -26,6 +302,8 @@ class OdooClient:
         password,
         timeout=10,
         verify_ssl=True,
+        metadata_cache_ttl=300,
+        disk_cache=None,
     ):
         """
         Initialize the Odoo client with connection parameters
@@ -37,6 +315,8 @@ class OdooClient:
             password: Login password
             timeout: Connection timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            metadata_cache_ttl: Seconds model and field definitions stay cached
+            disk_cache: Optional DiskCache persisting metadata across restarts
         """
         # Ensure URL has a protocol
         if not re.match(r"^https?://", url):
@@ -59,6 +339,13 @@ class OdooClient:
         self._common = None
         self._models = None
 
+        # Stock Odoo does not implement system.multicall; remember once it fails
+        self._multicall_supported = True
+
+        # Model catalogue and field definitions only change on module updates
+        self.metadata_cache = MetadataCache(ttl=metadata_cache_ttl)
+        self.disk_cache = disk_cache
+
         # Parse hostname for logging
         parsed_url = urllib.parse.urlparse(self.url)
         self.hostname = parsed_url.netloc
@@ -138,6 +425,9 @@ class OdooClient:
             >>> print(models)
             {"res.partner": {"name": "Reset View Architecture Wizard"}}
         """
+        cached = self.metadata_cache.get(("models",))
+        if cached is not None:
+            return cached
         try:
             # First search for model IDs
             model_ids = self._execute("ir.model", "search", [])
@@ -160,6 +450,7 @@ class OdooClient:
                 rec["model"]: {"name": rec.get("name", "")} for rec in result
             }
 
+            self.metadata_cache.set(("models",), models_info)
             return models_info
         except Exception as e:
             _logger.info(f"Error retrieving models: {str(e)}")
@@ -181,6 +472,9 @@ class OdooClient:
             >>> print(info['name'])
             'Contact'
         """
+        cached = self.metadata_cache.get(("model_info", model_name))
+        if cached is not None:
+            return cached
         try:
             result = self._execute(
                 "ir.model",
@@ -192,6 +486,7 @@ class OdooClient:
             if not result:
                 return {"error": f"Model {model_name} not found"}
 
+            self.metadata_cache.set(("model_info", model_name), result[0])
             return result[0]
         except Exception as e:
             _logger.info(f"Error retrieving model info: {str(e)}")
@@ -205,7 +500,8 @@ class OdooClient:
             model_name: Name of the model (e.g., 'res.partner')
 
         Returns:
-            Dictionary mapping field names to their definitions
+            Dictionary mapping field names to their definitions, limited to
+            the attributes in _FIELD_ATTRIBUTES
 
         Examples:
             >>> client = OdooClient(url, db, username, password)
@@ -213,13 +509,104 @@ class OdooClient:
             >>> print(fields['name']['type'])
             'char'
         """
+        cached = self.metadata_cache.get(("fields", model_name))
+        if cached is not None:
+            return cached
         try:
-            fields = self._execute(model_name, "fields_get")
+            fields = self._execute(
+                model_name, "fields_get", attributes=_FIELD_ATTRIBUTES
+            )
+            self.metadata_cache.set(("fields", model_name), fields)
             return fields
         except Exception as e:
             _logger.info(f"Error retrieving fields: {str(e)}")
             return {"error": str(e)}
 
+    def multicall(self, calls: Sequence[_Call]) -> List[Any]:
+        """
+        Execute several model methods in a single XML-RPC round-trip
+
+        The calls are sent as one ``system.multicall`` request. Stock Odoo
+        does not implement it, so after the first refusal the calls are
+        executed one after the other instead.
+
+        Args:
+            calls: List of (model, method, args, kwargs) tuples
+
+        Returns:
+            List with, for each call in order, its result or the exception
+            it raised
+
+        Examples:
+            >>> client = OdooClient(url, db, username, password)
+            >>> count, fields = client.multicall([
+            ...     ('res.partner', 'search_count', [[]], {}),
+            ...     ('res.partner', 'fields_get', [], {}),
+            ... ])
+        """
+        if self._multicall_supported:
+            multicall = xmlrpc.client.MultiCall(self._models)
+            for model, method, args, kwargs in calls:
+                multicall.execute_kw(
+                    self.db, self.uid, self.password, model, method, args, kwargs
+                )
+            try:
+                results = multicall()
+            except xmlrpc.client.Fault as e:
+                _logger.info(f"system.multicall not supported, falling back: {str(e)}")
+                self._multicall_supported = False
+            else:
+                # MultiCallIterator raises the Fault of a failed call on access
+                outcomes: List[Any] = []
+                for index in range(len(calls)):
+                    try:
+                        outcomes.append(results[index])
+                    except xmlrpc.client.Fault as e:
+                        outcomes.append(e)
+                return outcomes
+
+        outcomes = []
+        for model, method, args, kwargs in calls:
+            try:
+                outcomes.append(self._execute(model, method, *args, **kwargs))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def get_model_info_with_fields(self, model_name: str) -> Dict[str, Any]:
+        """
+        Get information and field definitions of a model in one round-trip
+
+        Both requests are sent together through :meth:`multicall`.
+
+        Args:
+            model_name: Name of the model (e.g., 'res.partner')
+
+        Returns:
+            Dictionary with model information and its field definitions
+            under the ``fields`` key
+
+        Examples:
+            >>> client = OdooClient(url, db, username, password)
+            >>> info = client.get_model_info_with_fields('res.partner')
+            >>> print(info['fields']['name']['type'])
+            'char'
+        """
+        model_info: Optional[Dict[str, Any]] = self.metadata_cache.get(
+            ("model_info", model_name)
+        )
+        fields = self.metadata_cache.get(("fields", model_name))
+        if model_info is not None and fields is not None:
+            model_info["fields"] = fields
+            return model_info
+
+        info_result, fields_result = self.multicall(_model_info_calls(model_name))
+        if not isinstance(info_result, Exception) and info_result:
+            self.metadata_cache.set(("model_info", model_name), info_result[0])
+        if not isinstance(fields_result, Exception):
+            self.metadata_cache.set(("fields", model_name), fields_result)
+        return _merge_model_info(model_name, info_result, fields_result)
+
     def search_count(
         self, model_name, domain
     ):
@@ -246,45 +633,35 @@ class OdooClient:
             _logger.info(f"Error in search_read: {str(e)}")
             return -1
 
-    def search_read(
-        self, model_name, domain, fields=None, offset=None, limit=None, order=None
-    ):
+    def search_read_iter(
+        self,
+        model_name: str,
+        domain: List[Any],
+        fields: Optional[List[str]] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: int = 500,
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Search for records and read their data in a single call
+        Search for records and yield them page by page
 
-        Args:
-            model_name: Name of the model (e.g., 'res.partner')
-            domain: Search domain (e.g., [('is_company', '=', True)])
-            fields: List of field names to return (None for all)
-            offset: Number of records to skip
-            limit: Maximum number of records to return
-            order: Sorting criteria (e.g., 'name ASC, id DESC')
-
-        Returns:
-            List of dictionaries with the matching records
-
-        Examples:
-            >>> client = OdooClient(url, db, username, password)
-            >>> records = client.search_read('res.partner', [('is_company', '=', True)], limit=5)
-            >>> print(len(records))
-            5
+        Synchronous counterpart of OdooAsyncClient.search_read_iter, see there
+        for the arguments.
         """
-        try:
-            kwargs = {}
-            if offset:
-                kwargs["offset"] = offset
+        offset = 0
+        while limit is None or offset < limit:
+            size = page if limit is None else min(page, limit - offset)
+            kwargs: Dict[str, Any] = {"offset": offset, "limit": size, "order": order or "id"}
             if fields is not None:
                 kwargs["fields"] = fields
-            if limit is not None:
-                kwargs["limit"] = limit
-            if order is not None:
-                kwargs["order"] = order
 
-            result = self._execute(model_name, "search_read", domain, kwargs)
-            return result
-        except Exception as e:
-            _logger.info(f"Error in search_read: {str(e)}")
-            return []
+            records = self._execute(model_name, "search_read", domain, **kwargs)
+            if not records:
+                return
+            yield records
+            if len(records) < size:
+                return
+            offset += len(records)
 
     def read_records(self, model_name, ids, fields=None):
         """
@@ -309,13 +686,394 @@ class OdooClient:
             if fields is not None:
                 kwargs["fields"] = fields
 
-            result = self._execute(model_name, "read", ids, kwargs)
+            result = self._execute(model_name, "read", ids, **kwargs)
             return result
         except Exception as e:
             _logger.info(f"Error reading records: {str(e)}")
             return []
 
 
+class OdooAsyncClient:
+    """Asynchronous client for Odoo XML-RPC calls over a pooled httpx client"""
+
+    def __init__(
+        self, client: OdooClient, http: httpx.AsyncClient, max_redirects: int = 5
+    ) -> None:
+        """
+        Initialize the async client from an authenticated OdooClient
+
+        Args:
+            client: Authenticated OdooClient providing URL, database and credentials
+            http: httpx.AsyncClient used to send the XML-RPC requests
+            max_redirects: Maximum number of redirects to follow per request
+        """
+        self.url = client.url
+        self.db = client.db
+        self.uid = client.uid
+        self.password = client.password
+        self.max_redirects = max_redirects
+        self._http = http
+        # Shared with the sync client so every session benefits from it; the
+        # multicall support flag is read from and written back to the client
+        self._client = client
+        self.metadata_cache = client.metadata_cache
+        self.disk_cache = client.disk_cache
+
+        # Background refreshes of stale disk cache entries, by cache key
+        self._refresh_tasks: Dict[str, "asyncio.Task[None]"] = {}
+
+    async def _call(self, endpoint: str, method: str, *params: Any) -> Any:
+        """Send an XML-RPC request to an endpoint and return its result"""
+        url = f"{self.url}/xmlrpc/2/{endpoint}"
+        body = xmlrpc.client.dumps(params, method)
+        for _ in range(self.max_redirects):
+            response = await self._http.post(
+                url, content=body, headers={"Content-Type": "text/xml"}
+            )
+            if response.is_redirect and response.headers.get("location"):
+                url = urllib.parse.urljoin(url, response.headers["location"])
+                continue
+            if response.status_code != 200:
+                raise xmlrpc.client.ProtocolError(
+                    url,
+                    response.status_code,
+                    response.reason_phrase,
+                    dict(response.headers),
+                )
+            # Raises xmlrpc.client.Fault if Odoo returned an error
+            result, _ = xmlrpc.client.loads(response.content)
+            return result[0]
+
+        raise xmlrpc.client.ProtocolError(url, 310, "Too many redirects", {})
+
+    async def _execute(
+        self, model: str, method: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Execute a method on an Odoo model"""
+        return await self._call(
+            "object",
+            "execute_kw",
+            self.db,
+            self.uid,
+            self.password,
+            model,
+            method,
+            args,
+            kwargs,
+        )
+
+    async def execute_method(
+        self, model: str, method: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Execute an arbitrary method on a model, see OdooClient.execute_method"""
+        return await self._execute(model, method, *args, **kwargs)
+
+    async def _store(self, memory_key: Hashable, disk_key: str, value: Any) -> None:
+        """Store metadata in the memory cache and, if enabled, on disk"""
+        self.metadata_cache.set(memory_key, value)
+        if self.disk_cache is not None:
+            # Field definitions can be large, keep the file I/O off the loop
+            await asyncio.to_thread(self.disk_cache.write, disk_key, value)
+
+    async def _cached(
+        self,
+        memory_key: Hashable,
+        disk_key: str,
+        refresh: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Look metadata up in the memory cache, then in the disk cache
+
+        A stale disk entry is still returned, while ``refresh()`` fetches a
+        new copy in the background. Returns None when nothing is cached.
+        """
+        value = self.metadata_cache.get(memory_key)
+        if value is not None or self.disk_cache is None:
+            return value
+
+        value, fresh = await asyncio.to_thread(self.disk_cache.read, disk_key)
+        if value is None:
+            return None
+        if not fresh and disk_key not in self._refresh_tasks:
+            task = asyncio.create_task(self._refresh(disk_key, refresh))
+            self._refresh_tasks[disk_key] = task
+            task.add_done_callback(lambda _: self._refresh_tasks.pop(disk_key, None))
+        self.metadata_cache.set(memory_key, value)
+        return value
+
+    async def _refresh(
+        self, disk_key: str, refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Refresh a stale disk cache entry, keeping the stale copy on failure"""
+        try:
+            await refresh()
+        except Exception as e:
+            _logger.info(f"Could not refresh cached {disk_key}, serving stale copy: {str(e)}")
+
+    async def _fetch_models(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Fetch the model list from Odoo and cache it, None if there is none"""
+        model_ids = await self._execute("ir.model", "search", [])
+        if not model_ids:
+            return None
+
+        result = await self._execute(
+            "ir.model", "read", model_ids, ["model", "name"])
+
+        models_info = {
+            rec["model"]: {"name": rec.get("name", "")} for rec in result
+        }
+        await self._store(("models",), "models", models_info)
+        return models_info
+
+    async def _fetch_model_info(self, model_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch the ir.model row of a model and cache it, None if there is none"""
+        result = await self._execute(
+            "ir.model",
+            "search_read",
+            [("model", "=", model_name)],
+            fields=["name", "model"],
+        )
+        if not result:
+            return None
+        model_info: Dict[str, Any] = result[0]
+        await self._store_model_info(model_name, model_info)
+        return model_info
+
+    async def _store_model_info(
+        self, model_name: str, model_info: Dict[str, Any]
+    ) -> None:
+        """Cache the ir.model row of a model"""
+        await self._store(
+            ("model_info", model_name), f"model_info/{model_name}", model_info
+        )
+
+    def _cached_model_info(
+        self, model_name: str
+    ) -> Awaitable[Optional[Dict[str, Any]]]:
+        """Return the cached ir.model row of a model, or None"""
+        return self._cached(
+            ("model_info", model_name),
+            f"model_info/{model_name}",
+            lambda: self._fetch_model_info(model_name),
+        )
+
+    async def _fetch_fields(self, model_name: str) -> Dict[str, Dict[str, Any]]:
+        """Fetch the field definitions of a model from Odoo and cache them"""
+        fields: Dict[str, Dict[str, Any]] = await self._execute(
+            model_name, "fields_get", attributes=_FIELD_ATTRIBUTES
+        )
+        await self._store_fields(model_name, fields)
+        return fields
+
+    async def _store_fields(
+        self, model_name: str, fields: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Cache the field definitions of a model"""
+        await self._store(("fields", model_name), f"fields/{model_name}", fields)
+        # Replace the types derived from the previous definitions
+        self.metadata_cache.set(("field_types", model_name), _field_types(fields))
+
+    def _cached_fields(
+        self, model_name: str
+    ) -> Awaitable[Optional[Dict[str, Dict[str, Any]]]]:
+        """Return cached field definitions of a model, or None"""
+        return self._cached(
+            ("fields", model_name),
+            f"fields/{model_name}",
+            lambda: self._fetch_fields(model_name),
+        )
+
+    async def cached_field_types(
+        self, model_name: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Return the Odoo type of each field of a model, or None when its field
+        definitions are not cached; Odoo is never called for them
+        """
+        field_types: Optional[Dict[str, Optional[str]]] = self.metadata_cache.get(
+            ("field_types", model_name)
+        )
+        if field_types is not None:
+            return field_types
+        fields = await self._cached_fields(model_name)
+        if fields is None:
+            return None
+        field_types = _field_types(fields)
+        self.metadata_cache.set(("field_types", model_name), field_types)
+        return field_types
+
+    async def get_models(self) -> Dict[str, Any]:
+        """
+        Get all available models, see OdooClient.get_models
+
+        Unlike the sync client, Odoo and connection errors are raised so the
+        tools can report them as failures.
+        """
+        cached: Optional[Dict[str, Any]] = await self._cached(
+            ("models",), "models", self._fetch_models
+        )
+        if cached is not None:
+            return cached
+        models_info = await self._fetch_models()
+        if models_info is None:
+            return {
+                "error": "No models found",
+            }
+        return models_info
+
+    async def get_model_info(self, model_name: str) -> Dict[str, Any]:
+        """
+        Get information about a model, see OdooClient.get_model_info
+
+        Odoo and connection errors are raised, see get_models.
+        """
+        cached = await self._cached_model_info(model_name)
+        if cached is not None:
+            return cached
+        model_info = await self._fetch_model_info(model_name)
+        if model_info is None:
+            return {"error": f"Model {model_name} not found"}
+        return model_info
+
+    async def multicall(self, calls: Sequence[_Call]) -> List[Any]:
+        """
+        Execute several model methods in one round-trip, see
+        OdooClient.multicall
+
+        Without ``system.multicall`` support the calls run concurrently.
+        """
+        if self._client._multicall_supported:
+            entries = [
+                {
+                    "methodName": "execute_kw",
+                    "params": [
+                        self.db, self.uid, self.password, model, method, args, kwargs
+                    ],
+                }
+                for model, method, args, kwargs in calls
+            ]
+            try:
+                results = await self._call("object", "system.multicall", entries)
+            except xmlrpc.client.Fault as e:
+                _logger.info(f"system.multicall not supported, falling back: {str(e)}")
+                self._client._multicall_supported = False
+            else:
+                # Successful entries are wrapped in a one-item list, failures
+                # are fault structs
+                return [
+                    xmlrpc.client.Fault(result["faultCode"], result["faultString"])
+                    if isinstance(result, dict)
+                    else result[0]
+                    for result in results
+                ]
+
+        return await asyncio.gather(
+            *(
+                self._execute(model, method, *args, **kwargs)
+                for model, method, args, kwargs in calls
+            ),
+            return_exceptions=True,
+        )
+
+    async def get_model_info_with_fields(self, model_name: str) -> Dict[str, Any]:
+        """
+        Get model information and fields in one round-trip, see
+        OdooClient.get_model_info_with_fields
+
+        Both parts are served from the memory or disk cache when possible,
+        so a model seen before can still be described while Odoo is down.
+        """
+        model_info: Optional[Dict[str, Any]] = await self._cached_model_info(
+            model_name
+        )
+        fields = await self._cached_fields(model_name)
+        if model_info is not None and fields is not None:
+            model_info["fields"] = fields
+            return model_info
+
+        info_result, fields_result = await self.multicall(_model_info_calls(model_name))
+        if not isinstance(info_result, Exception) and info_result:
+            await self._store_model_info(model_name, info_result[0])
+        elif isinstance(info_result, Exception) and model_info is not None:
+            info_result = [model_info]
+        if not isinstance(fields_result, Exception):
+            await self._store_fields(model_name, fields_result)
+        elif fields is not None:
+            fields_result = fields
+        if isinstance(info_result, Exception) and isinstance(
+            fields_result, Exception
+        ):
+            # Nothing to describe the model with, e.g. Odoo is unreachable
+            raise info_result
+        return _merge_model_info(model_name, info_result, fields_result)
+
+    async def search_read_iter(
+        self,
+        model_name: str,
+        domain: List[Any],
+        fields: Optional[List[str]] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: int = 500,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Search for records and yield them page by page
+
+        Issues successive search_read calls with increasing offsets so that
+        only one page of records is held in memory at a time.
+
+        Args:
+            model_name: Name of the model (e.g., 'res.partner')
+            domain: Search domain (e.g., [('is_company', '=', True)])
+            fields: List of field names to return (None for all)
+            order: Sorting criteria, defaults to 'id' for stable paging
+            limit: Maximum number of records to yield in total (None for all)
+            page: Number of records fetched per call
+
+        Yields:
+            Lists of at most ``page`` record dictionaries
+        """
+        offset = 0
+        while limit is None or offset < limit:
+            size = page if limit is None else min(page, limit - offset)
+            kwargs: Dict[str, Any] = {"offset": offset, "limit": size, "order": order or "id"}
+            if fields is not None:
+                kwargs["fields"] = fields
+
+            records = await self._execute(model_name, "search_read", domain, **kwargs)
+            if not records:
+                return
+            yield records
+            if len(records) < size:
+                return
+            offset += len(records)
+
+    async def search_count(self, model_name: str, domain: List[Any]) -> int:
+        """
+        Count records matching a domain, see OdooClient.search_count
+
+        Odoo and connection errors are raised instead of returning -1.
+        """
+        return cast(int, await self._execute(model_name, "search_count", domain))
+
+    async def read_records(
+        self, model_name: str, ids: List[int], fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read records by IDs, see OdooClient.read_records
+
+        Odoo and connection errors are raised instead of returning [].
+        """
+        kwargs: Dict[str, Any] = {}
+        if fields is not None:
+            kwargs["fields"] = fields
+
+        records: List[Dict[str, Any]] = await self._execute(
+            model_name, "read", ids, **kwargs
+        )
+        return records
+
+
 class RedirectTransport(xmlrpc.client.Transport):
     """Transport that adds timeout, SSL verification, and redirect handling"""
 
@@ -329,12 +1087,22 @@ class RedirectTransport(xmlrpc.client.Transport):
         self.max_redirects = max_redirects
         self.proxy = proxy or os.environ.get("HTTP_PROXY")
 
+        # The kept-alive connection can only carry one request at a time
+        self._lock = threading.Lock()
+
         if use_https and not verify_ssl:
             import ssl
 
             self.context = ssl._create_unverified_context()
 
     def make_connection(self, host):
+        """Return the kept-alive connection to host, opening it if needed"""
+        if self._connection[1] and self._connection[0] == host:
+            return self._connection[1]
+
+        # Only one connection is kept, close the one to the previous host
+        self.close()
+
         if self.proxy:
             proxy_url = urllib.parse.urlparse(self.proxy)
             connection = http.client.HTTPConnection(
@@ -354,6 +1122,7 @@ class RedirectTransport(xmlrpc.client.Transport):
                     connection = http.client.HTTPConnection(
                         host, timeout=self.timeout)
 
+        self._connection = host, connection
         return connection
 
     def request(self, host, handler, request_body, verbose):
@@ -361,8 +1130,9 @@ class RedirectTransport(xmlrpc.client.Transport):
         redirects = 0
         while redirects < self.max_redirects:
             try:
-                _logger.info(f"Making request to {host}{handler}")
-                return super().request(host, handler, request_body, verbose)
+                _logger.debug("Making request to %s%s", host, handler)
+                with self._lock:
+                    return super().request(host, handler, request_body, verbose)
             except xmlrpc.client.ProtocolError as err:
                 if err.errcode in (301, 302, 303, 307, 308) and err.headers.get(
                     "location"
@@ -438,6 +1208,9 @@ def get_odoo_client():
     )  # Increase default timeout to 30 seconds
     verify_ssl = os.environ.get("ODOO_VERIFY_SSL", "1").lower() in [
         "1", "true", "yes"]
+    metadata_cache_ttl = int(os.environ.get("ODOO_METADATA_CACHE_TTL", "300"))
+    disk_cache_disabled = os.environ.get("ODOO_MCP_DISABLE_CACHE", "0").lower() in [
+        "1", "true", "yes"]
 
     # Print detailed configuration
     _logger.info("Odoo client configuration:")
@@ -446,6 +1219,8 @@ def get_odoo_client():
     _logger.info(f"  Username: {config['username']}")
     _logger.info(f"  Timeout: {timeout}s")
     _logger.info(f"  Verify SSL: {verify_ssl}")
+    _logger.info(f"  Metadata cache TTL: {metadata_cache_ttl}s")
+    _logger.info(f"  Disk cache: {'disabled' if disk_cache_disabled else 'enabled'}")
 
     return OdooClient(
         url=config["url"],
@@ -454,4 +1229,8 @@ def get_odoo_client():
         password=config["password"],
         timeout=timeout,
         verify_ssl=verify_ssl,
+        metadata_cache_ttl=metadata_cache_ttl,
+        disk_cache=(
+            None if disk_cache_disabled else DiskCache(config["url"], config["db"])
+        ),
     )
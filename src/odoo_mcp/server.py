@@ -4,25 +4,266 @@ MCP server for Odoo integration
 Provides MCP tools and resources for interacting with Odoo ERP systems
 """
 
+import asyncio
+import functools
+import importlib.resources
+import inspect
 import logging
-import json
+import os
+import threading
+import time
+import xmlrpc.client
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, AsyncIterator, Dict, List, Optional, Union, cast, TypeVar, Generic
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
+from urllib.parse import unquote
 
-from pydantic import BaseModel, Field
+import httpx
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.fastmcp.exceptions import ToolError
 
-from .odoo_client import OdooClient, get_odoo_client
+from .odoo_client import (
+    OdooAsyncClient,
+    OdooClient,
+    get_odoo_client,
+    prepare_domain,
+)
 
 _logger = logging.getLogger(__name__)
 
+# Authenticated Odoo client shared by every session, tool and resource
+_ODOO: Optional[OdooClient] = None
+_ODOO_CLIENT_LOCK = threading.Lock()
+_ODOO_CLIENT_STATS: Dict[str, float] = {"hits": 0, "misses": 0, "init_ms_total": 0.0}
+
+# Immutable defaults for optional list arguments of the tools
+_EMPTY_DOMAIN: tuple = ()
+_EMPTY_GROUPBY: tuple = ()
+
+# Records returned by search_read when no limit is given, and at most
+_DEFAULT_SEARCH_LIMIT = 200
+_MAX_SEARCH_LIMIT = 500
+
+# Registers search_read_unbounded and search_read_ndjson, which have no
+# limit, for bulk exports
+_ALLOW_UNBOUNDED_SEARCH = os.environ.get(
+    "ODOO_MCP_ALLOW_UNBOUNDED_SEARCH", "0"
+).lower() in ["1", "true", "yes"]
+
+# Turns ["ref", "ilike", "A1,B2"] into ["ref", "in", ["A1", "B2"]]. Opt-in:
+# "in" only matches whole values, where ilike also matched substrings
+_COMMA_TO_IN = os.environ.get("ODOO_MCP_COMMA_TO_IN", "0").lower() in [
+    "1", "true", "yes"
+]
+
+# IDs sent per read call by read_many, keeping XML-RPC payloads reasonable
+_READ_CHUNK_SIZE = 500
+
+# Fields returned by read, read_many and search_read when none are given.
+# Reading every field ships large text and binary fields such as
+# res.partner.image_1920, so callers must pass ["*"] to get them all.
+_DEFAULT_FIELDS: Dict[str, List[str]] = {
+    "res.partner": ["id", "name", "email", "phone", "is_company"],
+    "sale.order": ["id", "name", "partner_id", "amount_total", "state", "date_order"],
+    "purchase.order": [
+        "id", "name", "partner_id", "amount_total", "state", "date_order"
+    ],
+    "account.move": [
+        "id", "name", "partner_id", "invoice_date", "amount_total", "state"
+    ],
+    "product.template": ["id", "name", "default_code", "list_price", "type"],
+    "product.product": ["id", "name", "default_code", "list_price"],
+    "stock.move": ["id", "name", "product_id", "product_uom_qty", "state"],
+    "project.task": ["id", "name", "project_id", "stage_id"],
+}
+_FALLBACK_FIELDS = ["id", "display_name"]
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a resource payload to compact JSON"""
+    # No indentation: payloads are read by LLMs, whitespace only costs bytes
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _resolve_fields(
+    model_name: str, fields: Optional[List[str]]
+) -> Optional[List[str]]:
+    """
+    Return the fields to read: the model's default set when none are given,
+    None (all fields) for ["*"]
+    """
+    if fields is None:
+        return _DEFAULT_FIELDS.get(model_name, _FALLBACK_FIELDS)
+    if fields == ["*"]:
+        return None
+    return fields
+
+
+def _log_result(result: Any) -> None:
+    """Log the size of a tool result, dumping it in full only at DEBUG level"""
+    if _logger.isEnabledFor(logging.INFO):
+        size = len(result) if hasattr(result, "__len__") else -1
+        _logger.info("result size=%d", size)
+    # Lazy %r: large payloads are only formatted when DEBUG is enabled
+    _logger.debug("result: %r", result)
+
+
+def _tool_error(tool_name: str, error: Exception) -> Dict[str, Any]:
+    """Build the failure result of a tool, logging unexpected errors"""
+    # Odoo faults, e.g. an unknown field, are the caller's mistake
+    if isinstance(error, (ToolError, xmlrpc.client.Fault)):
+        return {"success": False, "error": str(error)}
+    if isinstance(error, ValueError):
+        return {"success": False, "error": f"Invalid input: {error}"}
+    _logger.exception("Tool %s failed", tool_name)
+    return {"success": False, "error": str(error)}
+
+
+def mcp_result(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap the return value of a tool in {"success": True, "result": ...}
+
+    Exceptions are turned into {"success": False, "error": ...}: ToolError
+    for expected failures such as a missing record, ValueError for invalid
+    arguments. Works for sync and async tools; apply it below @mcp.tool.
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                return _tool_error(fn.__name__, e)
+            _log_result(result)
+            return {"success": True, "result": result}
+
+    else:
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                return _tool_error(fn.__name__, e)
+            _log_result(result)
+            return {"success": True, "result": result}
+
+    # FastMCP reads the signature of the tool, which now returns the envelope
+    wrapper.__signature__ = inspect.signature(fn).replace(  # type: ignore[attr-defined]
+        return_annotation=Dict[str, Any]
+    )
+    return wrapper
+
+
 @dataclass
 class AppContext:
     """Application context for the MCP server"""
 
     odoo: OdooClient
+    odoo_async: OdooAsyncClient
+
+
+def _get_cached_odoo_client() -> OdooClient:
+    """
+    Return the shared Odoo client, connecting and authenticating on first use
+    """
+    global _ODOO
+
+    # Fast path without taking the lock once the client exists
+    if _ODOO is not None:
+        _ODOO_CLIENT_STATS["hits"] += 1
+        return _ODOO
+
+    with _ODOO_CLIENT_LOCK:
+        if _ODOO is None:
+            start = time.perf_counter()
+            _ODOO = get_odoo_client()
+            _ODOO_CLIENT_STATS["init_ms_total"] += (
+                time.perf_counter() - start
+            ) * 1000
+            _ODOO_CLIENT_STATS["misses"] += 1
+        else:
+            _ODOO_CLIENT_STATS["hits"] += 1
+        return _ODOO
+
+
+def _get_odoo_async(ctx: Context) -> OdooAsyncClient:
+    """
+    Return the async Odoo client held by the lifespan context of the session
+    """
+    return cast(AppContext, ctx.request_context.lifespan_context).odoo_async
+
+
+def _session_context() -> Optional[AppContext]:
+    """Return the lifespan context of the current MCP request, if any"""
+    try:
+        lifespan_context = mcp.get_context().request_context.lifespan_context
+    except ValueError:
+        # Outside of an MCP request, e.g. a resource function called directly
+        return None
+    return cast(AppContext, lifespan_context)
+
+
+async def _prepare_domain(
+    odoo_client: Optional[OdooAsyncClient], model_name: str, domain: Sequence[Any]
+) -> List[Any]:
+    """
+    Prepare a domain with prepare_domain, turning numeric strings into IDs
+    only for the fields the cached definitions of the model type as integer
+    or relational (only "id" when they are not cached)
+    """
+    field_types = (
+        None
+        if odoo_client is None
+        else await odoo_client.cached_field_types(model_name)
+    )
+    return prepare_domain(domain, _COMMA_TO_IN, field_types)
+
+
+async def _resource_call(method: str, *args: Any) -> Any:
+    """
+    Call an Odoo client method from a resource without blocking the event loop
+
+    Uses the async client of the current session, or runs the shared sync
+    client in a worker thread when read outside of an MCP request.
+    """
+    session = _session_context()
+    if session is None:
+        odoo_client = _get_cached_odoo_client()
+        return await asyncio.to_thread(getattr(odoo_client, method), *args)
+    return await getattr(session.odoo_async, method)(*args)
+
+
+async def _resource_search_pages(
+    model_name: str, domain: List[Any]
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield the records matching a domain page by page, see _resource_call"""
+    session = _session_context()
+    if session is None:
+        pages = _get_cached_odoo_client().search_read_iter(model_name, domain)
+        while (records := await asyncio.to_thread(next, pages, None)) is not None:
+            yield records
+        return
+    async for records in session.odoo_async.search_read_iter(model_name, domain):
+        yield records
 
 
 @asynccontextmanager
@@ -30,83 +271,38 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     """
     Application lifespan for initialization and cleanup
     """
-    # Initialize Odoo client on startup
-    odoo_client = get_odoo_client()
-
-    try:
-        yield AppContext(odoo=odoo_client)
-    finally:
-        # No cleanup needed for Odoo client
-        pass
-
-
-# Define a detailed prompt for the MCP tool
-ODOO_PROMPT = """
-# Odoo MCP Agent
-
-This agent helps you interact with Odoo ERP systems through a set of specialized tools.
-
-## Common Odoo Models
-- `res.partner` - Contacts (customers, suppliers, etc.)
-- `sale.order` - Sales orders/quotations
-- `purchase.order` - Purchase orders
-- `account.move` - Invoices, bills, and accounting entries
-- `product.template` - Product information
-- `product.product` - Product variants
-- `stock.move` - Inventory movements
-- `project.task` - Project tasks
-
-## Working with Odoo Domains
-Odoo uses domain expressions for filtering records. Domains are lists of criteria:
-
-```
-[
-  ["field_name", "operator", value],
-  ["another_field", "operator", value]
-]
-```
-
-### Common Operators
-- `=`, `!=`: Equality/inequality
-- `>`, `>=`, `<`, `<=`: Comparison
-- `like`, `ilike`: Pattern matching (% is wildcard)
-- `in`, `not in`: Value in list
-- `child_of`: Hierarchical search
-- `&`, `|`, `!`: Logical operators (default is &)
-
-### Domain Examples
-- Active companies: `[["is_company", "=", true], ["active", "=", true]]`
-- Recent sales: `[["create_date", ">", "2023-01-01"]]`
-- Specific status: `[["state", "in", ["draft", "sent"]]]`
-- Name search: `[["name", "ilike", "%search term%"]]`
-
-## Important Fields by Model
-- res.partner: name, email, phone, is_company, country_id
-- sale.order: name, partner_id, date_order, amount_total, state
-- product.template: name, list_price, default_code, categ_id, type
-- account.move: name, partner_id, invoice_date, amount_total, state
-
-## Tips for Effective Queries
-1. Always limit your result set when possible
-2. Use proper field types (dates as strings, IDs as integers)
-3. For relational fields, use the ID (integer) in domains
-4. For complex data analysis, use read_group for server-side aggregation
-5. Retrieve only the fields you need by specifying the fields parameter
-
-## Common Workflows
-- Get model data: Use model_info to explore fields
-- Find records: Use search_read with appropriate domains
-- Count records: Use search_count for quick counts
-- Analyze data: Use read_group for aggregations
-"""
+    # Reuse the Odoo client across sessions, authenticating only once
+    odoo_client = _get_cached_odoo_client()
+
+    # Pooled HTTP client so tool calls reuse keep-alive connections to Odoo.
+    # Like RedirectTransport, send every Odoo URL through HTTP_PROXY: httpx
+    # alone would only apply it to http:// URLs.
+    async with httpx.AsyncClient(
+        timeout=odoo_client.timeout,
+        verify=odoo_client.verify_ssl,
+        proxy=os.environ.get("HTTP_PROXY"),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        http2=False,
+    ) as http:
+        yield AppContext(
+            odoo=odoo_client, odoo_async=OdooAsyncClient(odoo_client, http)
+        )
+
+
+# Guidance for agents, kept in a Markdown file and read once at import
+ODOO_PROMPT = (
+    importlib.resources.files(__package__)
+    .joinpath("prompts/odoo.md")
+    .read_text(encoding="utf-8")
+)
 
 # Create MCP server
 mcp = FastMCP(
     name="Odoo MCP Server", 
     description="MCP Server for interacting with Odoo ERP systems",
-    dependencies=["requests"],
+    dependencies=["requests", "orjson"],
     lifespan=app_lifespan,
-    prompt=ODOO_PROMPT,
+    instructions=ODOO_PROMPT,
 )
 
 
@@ -115,43 +311,40 @@ mcp = FastMCP(
 @mcp.resource(
     "odoo://models", description="List all available models in the Odoo system"
 )
-def get_models() -> str:
+async def get_models() -> str:
     """Lists all available models in the Odoo system"""
-    odoo_client = get_odoo_client()
-    models = odoo_client.get_models()
-    return json.dumps(models, indent=2)
+    try:
+        models = await _resource_call("get_models")
+        return _dumps(models)
+    except Exception as e:
+        return _dumps({"error": str(e)})
 
 
 @mcp.resource(
     "odoo://model/{model_name}",
     description="Get detailed information about a specific model including fields",
 )
-def get_model_info(model_name: str) -> str:
+async def get_model_info(model_name: str) -> str:
     """
     Get information about a specific model
 
     Parameters:
         model_name: Name of the Odoo model (e.g., 'res.partner')
     """
-    odoo_client = get_odoo_client()
     try:
-        # Get model info
-        model_info = odoo_client.get_model_info(model_name)
+        # Get model info and field definitions in one round-trip
+        model_info = await _resource_call("get_model_info_with_fields", model_name)
 
-        # Get field definitions
-        fields = odoo_client.get_model_fields(model_name)
-        model_info["fields"] = fields
-
-        return json.dumps(model_info, indent=2)
+        return _dumps(model_info)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.resource(
     "odoo://record/{model_name}/{record_id}",
     description="Get detailed information of a specific record by ID",
 )
-def get_record(model_name: str, record_id: str) -> str:
+async def get_record(model_name: str, record_id: str) -> str:
     """
     Get a specific record by ID
 
@@ -159,24 +352,25 @@ def get_record(model_name: str, record_id: str) -> str:
         model_name: Name of the Odoo model (e.g., 'res.partner')
         record_id: ID of the record
     """
-    odoo_client = get_odoo_client()
     try:
         record_id_int = int(record_id)
-        record = odoo_client.read_records(model_name, [record_id_int])
+    except ValueError:
+        return _dumps({"error": f"Invalid record ID: {record_id}"})
+
+    try:
+        record = await _resource_call("read_records", model_name, [record_id_int])
         if not record:
-            return json.dumps(
-                {"error": f"Record not found: {model_name} ID {record_id}"}, indent=2
-            )
-        return json.dumps(record[0], indent=2)
+            return _dumps({"error": f"Record not found: {model_name} ID {record_id}"})
+        return _dumps(record[0])
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.resource(
     "odoo://search/{model_name}/{domain}",
     description="Search for records matching the domain",
 )
-def search_records_resource(model_name: str, domain: str) -> str:
+async def search_records_resource(model_name: str, domain: str) -> str:
     """
     Search for records that match a domain
 
@@ -184,18 +378,98 @@ def search_records_resource(model_name: str, domain: str) -> str:
         model_name: Name of the Odoo model (e.g., 'res.partner')
         domain: Search domain in JSON format (e.g., '[["name", "ilike", "test"]]')
     """
-    odoo_client = get_odoo_client()
     try:
-        results = odoo_client.search_read(model_name, domain)
-        return json.dumps(results, indent=2)
+        # Clients percent-encode the quotes and brackets of the URI
+        domain_list = orjson.loads(unquote(domain))
+    except orjson.JSONDecodeError as e:
+        return _dumps({"error": "bad domain JSON", "detail": str(e)})
+
+    try:
+        session = _session_context()
+        domain_list = await _prepare_domain(
+            session.odoo_async if session else None, model_name, domain_list
+        )
+
+        # Encode page by page so only one page of records is held at a time
+        output = bytearray(b"[")
+        async for records in _resource_search_pages(model_name, domain_list):
+            for record in records:
+                if len(output) > 1:
+                    output += b","
+                output += orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS)
+        output += b"]"
+        return output.decode()
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
+
+
+# ----- Tool Arguments -----
+
+# Models listed in the prompt; offered to clients as suggested values while
+# any other model name is still accepted
+CommonModels = Literal[
+    "res.partner",
+    "sale.order",
+    "purchase.order",
+    "account.move",
+    "product.template",
+    "product.product",
+    "stock.move",
+    "project.task",
+]
+ModelName = Union[CommonModels, str]
+
+
+class SearchReadArgs(BaseModel):
+    """Validated arguments of the search_read tool"""
+
+    model_config = ConfigDict(frozen=True)
+
+    model_name: ModelName = Field(
+        description="Technical name of the Odoo model (e.g., 'res.partner')"
+    )
+    domain: List[Any] = Field(
+        default_factory=list,
+        description="Odoo domain, e.g. [['is_company', '=', true]]",
+    )
+    fields: Optional[List[str]] = Field(
+        default=None,
+        description="Field names to return, a small default set if omitted, "
+        "['*'] for all fields",
+    )
+    limit: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Maximum number of records (default: 200, at most 500)",
+    )
+    offset: Optional[int] = Field(
+        default=None, ge=0, description="Number of records to skip (for pagination)"
+    )
+    order: Optional[str] = Field(
+        default=None, description="Sort order (e.g., 'name ASC, id DESC')"
+    )
+
+    @field_validator("domain", mode="before")
+    @classmethod
+    def _normalize_domain(cls, value: Any) -> List[Any]:
+        """
+        Normalize the domain into a list of conditions and logical operators
+
+        Accepts a JSON-encoded string; everything else, such as a single
+        bare condition, is handled by prepare_domain.
+        """
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = orjson.loads(value)
+        return prepare_domain(value, _COMMA_TO_IN)
 
 
 # ----- MCP Tools -----
 
 @mcp.tool(description="List all available models in the Odoo system")
-def list_models(ctx: Context) -> Dict[str, Any]:
+@mcp_result
+async def list_models(ctx: Context) -> Dict[str, Any]:
     """
     Retrieves all available models in the Odoo system.
     
@@ -208,18 +482,14 @@ def list_models(ctx: Context) -> Dict[str, Any]:
         "sale.order": {"name": "Sales Order"}
     }
     """
-    try:
-        odoo_client = get_odoo_client()
-        models = odoo_client.get_models()
-        _logger.info(models)
-        return {"success": True, "result": models}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    odoo_client = _get_odoo_async(ctx)
+    return await odoo_client.get_models()
 
 @mcp.tool(description="Get detailed information about a specific Odoo model including its fields definitions")
-def model_info(
+@mcp_result
+async def model_info(
     ctx: Context,
-    model_name: str,
+    model_name: ModelName,
 ) -> Dict[str, Any]:
     """
     Retrieves detailed information about an Odoo model including its fields definitions.
@@ -252,30 +522,58 @@ def model_info(
         - Sales model: model_name="sale.order"
         - Product model: model_name="product.template"
     """
-    try:
-        odoo_client = get_odoo_client()
-        model_info = odoo_client.get_model_info(model_name)
-        fields = odoo_client.get_model_fields(model_name)
-        model_info["fields"] = fields
-        _logger.info(model_info)
-        return {"success": True, "result": model_info}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    odoo_client = _get_odoo_async(ctx)
+    return await odoo_client.get_model_info_with_fields(model_name)
+
+@mcp.tool(description="Get detailed information about several Odoo models at once, including their fields definitions")
+@mcp_result
+async def model_info_bulk(
+    ctx: Context,
+    model_names: List[str],
+) -> Dict[str, Any]:
+    """
+    Retrieves information and fields definitions of several Odoo models in a single call.
+
+    The models are fetched concurrently, so asking for N models takes about as
+    long as asking for one. Prefer this over repeated model_info calls.
+
+    Parameters:
+        model_names: Technical names of the Odoo models (e.g., ['res.partner', 'sale.order'])
+
+    Returns a dictionary mapping each model name to the same information as
+    model_info, or to {"error": "..."} if that model could not be retrieved.
+
+    Examples:
+        - Sales models: model_names=["sale.order", "sale.order.line"]
+    """
+    odoo_client = _get_odoo_async(ctx)
+    names = list(dict.fromkeys(model_names))
+    results = await asyncio.gather(
+        *(odoo_client.get_model_info_with_fields(name) for name in names),
+        return_exceptions=True,
+    )
+    return {
+        name: {"error": str(info)} if isinstance(info, Exception) else info
+        for name, info in zip(names, results)
+    }
 
 @mcp.tool(description="Get detailed information of a specific record by ID from an Odoo model")
-def read(
+@mcp_result
+async def read(
     ctx: Context,
-    model_name: str,
-    record_id: Union[str, int],
+    model_name: ModelName,
+    record_id: int,
     fields: Optional[List[str]] = None,
-) -> Dict[str, Any]:
+) -> List[Dict[str, Any]]:
     """
     Retrieves a specific record by ID from an Odoo model.
 
     Parameters:
         model_name: Technical name of the Odoo model (e.g., 'res.partner', 'sale.order')
         record_id: Database ID of the record to retrieve
-        fields: List of specific fields to retrieve. If None, all fields are retrieved.
+        fields: List of specific fields to retrieve. If None, a small default set is
+               retrieved (e.g. id, name, email, phone, is_company for res.partner,
+               id and display_name for other models). Use ["*"] for all fields.
                Common fields by model:
                - res.partner: name, email, phone, street, city, country_id, is_company
                - sale.order: name, partner_id, date_order, amount_total, state
@@ -285,25 +583,61 @@ def read(
         - Get contact: model_name="res.partner", record_id=5
         - Get sale order with specific fields: model_name="sale.order", record_id=42, fields=["name", "amount_total", "state"]
     """
-    try:
-        odoo_client = get_odoo_client()
-        record_id_int = int(record_id)
-        record = odoo_client.read_records(model_name, [record_id_int], fields)
-        _logger.info(record)
-        if not record:
-            return {"success": False, "error": f"Record {record_id_int} not found in model {model_name}."}
-        return {"success": True, "result": record}
-    except ValueError:
-        return {"success": False, "error": f"Invalid record ID: {record_id}. Must be a valid integer."}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    odoo_client = _get_odoo_async(ctx)
+    fields = _resolve_fields(model_name, fields)
+    kwargs = {} if fields is None else {"fields": fields}
+    record: List[Dict[str, Any]] = await odoo_client.execute_method(
+        model_name, "read", [record_id], **kwargs
+    )
+    if not record:
+        raise ToolError(f"Record {record_id} not found in model {model_name}.")
+    return record
+
+@mcp.tool(description="Get several records by ID from an Odoo model in one call")
+@mcp_result
+async def read_many(
+    ctx: Context,
+    model_name: ModelName,
+    record_ids: List[int],
+    fields: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Retrieves several records by ID from an Odoo model in a single request.
+
+    Use this instead of calling read once per record: every call to read
+    costs a round-trip to Odoo, while read_many fetches up to 500 records
+    per request. Records that do not exist are left out of the result.
+
+    Parameters:
+        model_name: Technical name of the Odoo model (e.g., 'res.partner', 'sale.order')
+        record_ids: Database IDs of the records to retrieve
+        fields: List of specific fields to retrieve. If None, a small default set is
+               retrieved, as for read. Use ["*"] for all fields.
+
+    Examples:
+        - Get three contacts: model_name="res.partner", record_ids=[5, 7, 12]
+        - Get order totals: model_name="sale.order", record_ids=[42, 43], fields=["name", "amount_total"]
+    """
+    odoo_client = _get_odoo_async(ctx)
+    fields = _resolve_fields(model_name, fields)
+    kwargs = {} if fields is None else {"fields": fields}
+    chunks = await asyncio.gather(
+        *(
+            odoo_client.execute_method(
+                model_name, "read", record_ids[i:i + _READ_CHUNK_SIZE], **kwargs
+            )
+            for i in range(0, len(record_ids), _READ_CHUNK_SIZE)
+        )
+    )
+    return [record for chunk in chunks for record in chunk]
 
 @mcp.tool(description="Count records matching the domain criteria in an Odoo model")
-def search_count(
+@mcp_result
+async def search_count(
     ctx: Context,
-    model_name: str,
-    domain: List[Union[str, List[str]]] = [],
-) -> Dict[str, Any]:
+    model_name: ModelName,
+    domain: Optional[List[Any]] = None,
+) -> int:
     """
     Counts records in an Odoo model that match specified criteria.
 
@@ -323,74 +657,155 @@ def search_count(
             ["date", ">", "2023-01-01"]
           ]
     """
-    try:
-        odoo_client = get_odoo_client()
-        results = odoo_client.search_count(model_name, domain)
-        _logger.info(results)
-        return {"success": True, "result": results}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    odoo_client = _get_odoo_async(ctx)
+    return await odoo_client.search_count(
+        model_name,
+        await _prepare_domain(odoo_client, model_name, domain or _EMPTY_DOMAIN),
+    )
 
 @mcp.tool(description="Search and read records from an Odoo model that match specified criteria")
-def search_read(
+@mcp_result
+async def search_read(
+    ctx: Context,
+    args: SearchReadArgs,
+) -> List[Dict[str, Any]]:
+    """
+    Search and read records from an Odoo model that match specified criteria.
+
+    Parameters:
+        args: Search arguments with the following keys:
+            model_name: Technical name of the Odoo model (e.g., 'res.partner', 'sale.order')
+            domain: Odoo domain filter expressed as a list of conditions. Each condition is a list with 3 elements:
+                   [field_name, operator, value]
+
+                   Common operators: =, !=, >, >=, <, <=, like, ilike, in, not in, child_of
+            fields: List of field names to retrieve. If None, a small default set is
+                   retrieved, as for read. Use ["*"] for all fields.
+                   Common fields by model:
+                   - res.partner: name, email, phone, street, city, country_id, is_company
+                   - sale.order: name, partner_id, date_order, amount_total, state
+                   - product.template: name, list_price, default_code, categ_id
+            limit: Maximum number of records to return (default: 200, capped at 500)
+            offset: Number of records to skip (for pagination)
+            order: Sort order specification (e.g., "name ASC", "create_date DESC")
+
+    Examples:
+        - All contacts: args={"model_name": "res.partner"}
+        - Companies only: args={"model_name": "res.partner", "domain": [["is_company", "=", true]]}
+        - Recent sales: args={"model_name": "sale.order", "domain": [["create_date", ">", "2023-01-01"]]}
+        - Products by category: args={"model_name": "product.template", "domain": [["categ_id", "=", 4]]}
+    """
+    limit = min(args.limit or _DEFAULT_SEARCH_LIMIT, _MAX_SEARCH_LIMIT)
+    return await _search_read(ctx, args, limit)
+
+async def _search_read(
+    ctx: Context, args: SearchReadArgs, limit: Optional[int]
+) -> List[Dict[str, Any]]:
+    """Run search_read with an explicit limit, None for all records"""
+    odoo_client = _get_odoo_async(ctx)
+    kwargs = {
+        key: value
+        for key, value in (
+            ('fields', _resolve_fields(args.model_name, args.fields)),
+            ('limit', limit),
+            ('offset', args.offset),
+            ('order', args.order),
+        )
+        if value is not None
+    }
+    # SearchReadArgs validated args.domain, but the model's field types are
+    # only known here
+    domain = await _prepare_domain(odoo_client, args.model_name, args.domain)
+    records: List[Dict[str, Any]] = await odoo_client.execute_method(
+        args.model_name, 'search_read', domain, **kwargs
+    )
+    return records
+
+@mcp_result
+async def search_read_unbounded(
+    ctx: Context,
+    args: SearchReadArgs,
+) -> List[Dict[str, Any]]:
+    """
+    Search and read records like search_read, without its 500 record cap.
+
+    Returns every matching record when args.limit is omitted. Only meant for
+    bulk exports: large results are slow for Odoo and fill the context.
+    Only available when ODOO_MCP_ALLOW_UNBOUNDED_SEARCH is set.
+
+    Parameters:
+        args: Search arguments, same keys as for search_read
+    """
+    return await _search_read(ctx, args, args.limit)
+
+if _ALLOW_UNBOUNDED_SEARCH:
+    mcp.tool(
+        description="Search and read records without the search_read limit cap"
+    )(search_read_unbounded)
+
+@mcp_result
+async def search_read_ndjson(
     ctx: Context,
-    model_name: str,
-    domain: List[Union[str, List[str]]] = [],
+    model_name: ModelName,
+    domain: Optional[List[Any]] = None,
     fields: Optional[List[str]] = None,
-    limit: Optional[int] = None,
-    offset: Optional[int] = None,
+    limit: Annotated[Optional[int], Field(gt=0)] = None,
     order: Optional[str] = None,
-) -> Dict[str, Any]:
+    page_size: Annotated[int, Field(gt=0)] = 500,
+) -> str:
     """
-    Search and read records from an Odoo model that match specified criteria.
+    Exports records matching a domain as NDJSON: one JSON object per line.
+
+    The NDJSON text is returned as the result, e.g.
+    {"success": true, "result": "{...}\n{...}\n"}.
+
+    Records are fetched from Odoo in pages of page_size and encoded as they
+    arrive, so large exports do not hold every record in memory at once.
+    Prefer search_read for interactive queries; use this for bulk exports.
+    Only available when ODOO_MCP_ALLOW_UNBOUNDED_SEARCH is set.
 
     Parameters:
         model_name: Technical name of the Odoo model (e.g., 'res.partner', 'sale.order')
-        domain: Odoo domain filter expressed as a list of conditions. Each condition is a list with 3 elements:
-               [field_name, operator, value]
-               
-               Common operators: =, !=, >, >=, <, <=, like, ilike, in, not in, child_of
-        fields: List of field names to retrieve. If None, all fields are retrieved.
-               Common fields by model:
-               - res.partner: name, email, phone, street, city, country_id, is_company
-               - sale.order: name, partner_id, date_order, amount_total, state
-               - product.template: name, list_price, default_code, categ_id
-        limit: Maximum number of records to return (default: all records)
-        offset: Number of records to skip (for pagination)
-        order: Sort order specification (e.g., "name ASC", "create_date DESC")
-               
+        domain: Odoo domain filter, same format as for search_read
+        fields: List of field names to export. If None, a small default set is
+               exported, as for read. Use ["*"] for all fields.
+        limit: Maximum number of records to export (default: all matching records)
+        order: Sort order specification (default: "id")
+        page_size: Number of records fetched from Odoo per request (at least 1)
+
     Examples:
-        - All contacts: model_name="res.partner"
-        - Companies only: model_name="res.partner", domain=[["is_company", "=", true]]
-        - Recent sales: model_name="sale.order", domain=[["create_date", ">", "2023-01-01"]]
-        - Products by category: model_name="product.template", domain=[["categ_id", "=", 4]]
+        - Export all companies: model_name="res.partner", domain=[["is_company", "=", true]], fields=["name", "email"]
     """
-    try:
-        odoo_client = get_odoo_client()
-        kwargs = {}
-        if fields is not None:
-            kwargs['fields'] = fields
-        if limit is not None:
-            kwargs['limit'] = limit
-        if offset is not None:
-            kwargs['offset'] = offset
-        if order is not None:
-            kwargs['order'] = order
-        results = odoo_client.execute_method(model_name, 'search_read', domain, **kwargs)
-        _logger.info(results)
-        return {"success": True, "result": results}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    odoo_client = _get_odoo_async(ctx)
+    output = bytearray()
+    async for records in odoo_client.search_read_iter(
+        model_name,
+        await _prepare_domain(odoo_client, model_name, domain or _EMPTY_DOMAIN),
+        fields=_resolve_fields(model_name, fields),
+        order=order,
+        limit=limit,
+        page=page_size,
+    ):
+        for record in records:
+            output += orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return output.decode()
+
+
+if _ALLOW_UNBOUNDED_SEARCH:
+    mcp.tool(
+        description="Export records of an Odoo model as newline-delimited JSON"
+    )(search_read_ndjson)
 
 @mcp.tool(description="Group and aggregate data from Odoo models with optional aggregation functions")
-def read_group(
+@mcp_result
+async def read_group(
     ctx: Context,
-    model_name: str,
-    domain: List[Union[str, List[str]]] = [],
-    fields: List[str] = [],
-    groupby: List[str] = [],
+    model_name: ModelName,
+    domain: Optional[List[Any]] = None,
+    fields: Optional[List[str]] = None,
+    groupby: Optional[List[str]] = None,
     lazy: Optional[bool] = True,
-) -> Dict[str, Any]:
+) -> List[Dict[str, Any]]:
     """
     Groups and aggregates records from an Odoo model, similar to SQL GROUP BY with aggregate functions.
 
@@ -419,17 +834,66 @@ def read_group(
         - Total sales: model_name="sale.order", fields=["amount_total:sum"], groupby=[]
     """
     if not fields:
-        return {"success": False, "error": "The 'fields' parameter must not be empty"}
-    
-    try:
-        odoo_client = get_odoo_client()
-        kwargs = {}
-        kwargs['fields'] = fields
-        kwargs['groupby'] = groupby
-        kwargs['lazy'] = lazy
-        
-        results = odoo_client.execute_method(model_name, 'read_group', domain, **kwargs)
-        _logger.info(results)
-        return {"success": True, "result": results}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
\ No newline at end of file
+        raise ToolError("The 'fields' parameter must not be empty")
+
+    odoo_client = _get_odoo_async(ctx)
+    # lazy=None is left to Odoo's default rather than marshalled as nil
+    kwargs = {
+        key: value
+        for key, value in (
+            ('fields', fields),
+            ('groupby', groupby or _EMPTY_GROUPBY),
+            ('lazy', lazy),
+        )
+        if value is not None
+    }
+    groups: List[Dict[str, Any]] = await odoo_client.execute_method(
+        model_name,
+        'read_group',
+        await _prepare_domain(odoo_client, model_name, domain or _EMPTY_DOMAIN),
+        **kwargs,
+    )
+    return groups
+
+@mcp.tool(description="Report hit/miss statistics of the shared Odoo client cache")
+@mcp_result
+def get_cache_stats(ctx: Context) -> Dict[str, Any]:
+    """
+    Reports how often sessions and resources reused the shared Odoo client
+    instead of reconnecting.
+
+    Returns:
+    - hits: Number of times the already authenticated client was reused
+    - misses: Number of times a new client had to be created
+    - avg_init_ms: Average time spent creating and authenticating a client
+    """
+    misses = _ODOO_CLIENT_STATS["misses"]
+    return {
+        "hits": int(_ODOO_CLIENT_STATS["hits"]),
+        "misses": int(misses),
+        "avg_init_ms": (
+            _ODOO_CLIENT_STATS["init_ms_total"] / misses if misses else 0.0
+        ),
+    }
+
+@mcp.tool(description="Clear the cached Odoo model list and field definitions")
+@mcp_result
+async def invalidate_cache(ctx: Context) -> Dict[str, Any]:
+    """
+    Clears cached model metadata so the next list_models / model_info call
+    fetches it again from Odoo.
+
+    Model and field definitions are cached in memory and on disk for up to
+    a day because they only change when modules are installed or upgraded.
+    Call this after such a deployment to see the changes immediately.
+
+    Returns the number of entries dropped from memory and from disk.
+    """
+    odoo_client = _get_odoo_async(ctx)
+    cleared_files = (
+        0 if odoo_client.disk_cache is None else odoo_client.disk_cache.clear()
+    )
+    return {
+        "cleared": odoo_client.metadata_cache.clear(),
+        "cleared_files": cleared_files,
+    }
@@ -0,0 +1,20 @@
+"""
+Shared uvicorn settings for every Odoo MCP server entry point
+"""
+
+import sys
+from typing import Any, Dict
+
+# uvloop does not support Windows, fall back to the stdlib event loop there
+_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+
+UVICORN_CONFIG: Dict[str, Any] = {
+    "host": "0.0.0.0",
+    "port": 8000,
+    "loop": _LOOP,
+    "http": "httptools",
+    # Keep idle connections open long enough for chatty MCP clients
+    "timeout_keep_alive": 75,
+    "backlog": 2048,
+    "log_level": "info",
+}
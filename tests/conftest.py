@@ -0,0 +1,104 @@
+"""Shared fixtures: a fake Odoo answering XML-RPC over httpx.MockTransport"""
+
+import types
+import xmlrpc.client
+
+import httpx
+import pytest
+
+from odoo_mcp.odoo_client import MetadataCache, OdooAsyncClient
+
+
+class FakeOdoo:
+    """
+    XML-RPC endpoint dispatching execute_kw calls to per-method handlers
+
+    Register handlers with ``odoo.handlers[(model, method)] = fn``; they get
+    the positional and keyword arguments of the call. Responses queued in
+    ``odoo.responses`` are sent, or exceptions in it raised, before any
+    request is dispatched.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.responses = []
+        self.requests = []
+        self.multicall = False
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.responses:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        params, method = xmlrpc.client.loads(request.content)
+        try:
+            if method == "system.multicall":
+                result = self._multicall(params[0])
+            else:
+                result = self._execute(*params[3:])
+            body = xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True)
+        except xmlrpc.client.Fault as fault:
+            body = xmlrpc.client.dumps(fault, methodresponse=True)
+        return httpx.Response(200, content=body.encode())
+
+    def _multicall(self, entries):
+        if not self.multicall:
+            raise xmlrpc.client.Fault(1, "Method not available system.multicall")
+        results = []
+        for entry in entries:
+            try:
+                results.append([self._execute(*entry["params"][3:])])
+            except xmlrpc.client.Fault as fault:
+                results.append(
+                    {"faultCode": fault.faultCode, "faultString": fault.faultString}
+                )
+        return results
+
+    def _execute(self, model, method, args, kwargs):
+        handler = self.handlers.get((model, method))
+        if handler is None:
+            raise xmlrpc.client.Fault(2, f"Unknown method {model}.{method}")
+        return handler(*args, **kwargs)
+
+    @property
+    def calls(self):
+        """(model, method, args, kwargs) of every execute_kw request"""
+        calls = []
+        for request in self.requests:
+            params, method = xmlrpc.client.loads(request.content)
+            if method == "execute_kw":
+                calls.append(tuple(params[3:]))
+        return calls
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def odoo():
+    return FakeOdoo()
+
+
+@pytest.fixture
+def shared_client():
+    """Stand-in for the authenticated OdooClient the async clients share"""
+    return types.SimpleNamespace(
+        url="http://odoo.test",
+        db="db",
+        uid=2,
+        password="secret",
+        _multicall_supported=True,
+        metadata_cache=MetadataCache(),
+        disk_cache=None,
+    )
+
+
+@pytest.fixture
+async def async_client(odoo, shared_client):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(odoo)) as http:
+        yield OdooAsyncClient(shared_client, http)
@@ -0,0 +1,170 @@
+"""Tests for OdooAsyncClient against a fake Odoo"""
+
+import asyncio
+import os
+import time
+import xmlrpc.client
+
+import httpx
+import pytest
+
+from odoo_mcp.disk_cache import DiskCache
+from odoo_mcp.odoo_client import OdooAsyncClient
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_execute_sends_execute_kw(odoo, async_client):
+    odoo.handlers[("res.partner", "search_count")] = lambda domain: 42
+
+    assert await async_client.execute_method(
+        "res.partner", "search_count", [["is_company", "=", True]]
+    ) == 42
+    request = odoo.requests[0]
+    assert request.url == "http://odoo.test/xmlrpc/2/object"
+    params, method = xmlrpc.client.loads(request.content)
+    assert method == "execute_kw"
+    assert params == (
+        "db", 2, "secret", "res.partner", "search_count",
+        [[["is_company", "=", True]]], {},
+    )
+
+
+async def test_call_follows_redirects(odoo, async_client):
+    odoo.responses.append(
+        httpx.Response(301, headers={"location": "https://odoo.test/xmlrpc/2/object"})
+    )
+    odoo.handlers[("res.partner", "search_count")] = lambda domain: 1
+
+    assert await async_client.execute_method("res.partner", "search_count", []) == 1
+    assert [str(request.url) for request in odoo.requests] == [
+        "http://odoo.test/xmlrpc/2/object",
+        "https://odoo.test/xmlrpc/2/object",
+    ]
+
+
+async def test_call_gives_up_after_too_many_redirects(odoo, async_client):
+    odoo.responses.extend(
+        httpx.Response(302, headers={"location": "/xmlrpc/2/object"})
+        for _ in range(async_client.max_redirects)
+    )
+
+    with pytest.raises(xmlrpc.client.ProtocolError) as excinfo:
+        await async_client.execute_method("res.partner", "search_count", [])
+    assert excinfo.value.errcode == 310
+
+
+async def test_call_raises_on_http_errors(odoo, async_client):
+    odoo.responses.append(httpx.Response(502, text="Bad Gateway"))
+
+    with pytest.raises(xmlrpc.client.ProtocolError) as excinfo:
+        await async_client.execute_method("res.partner", "search_count", [])
+    assert excinfo.value.errcode == 502
+
+
+async def test_call_raises_odoo_faults(async_client):
+    with pytest.raises(xmlrpc.client.Fault) as excinfo:
+        await async_client.execute_method("res.partner", "unlink_all", [])
+    assert excinfo.value.faultString == "Unknown method res.partner.unlink_all"
+
+
+MULTICALL = [
+    ("res.partner", "search_count", [[]], {}),
+    ("res.partner", "unlink_all", [], {}),
+]
+
+
+async def test_multicall_decodes_results_and_faults(odoo, async_client):
+    odoo.multicall = True
+    odoo.handlers[("res.partner", "search_count")] = lambda domain: 7
+
+    count, fault = await async_client.multicall(MULTICALL)
+    assert count == 7
+    assert isinstance(fault, xmlrpc.client.Fault)
+    assert fault.faultString == "Unknown method res.partner.unlink_all"
+    assert len(odoo.requests) == 1
+
+
+async def test_multicall_falls_back_once_for_all_sessions(
+    odoo, async_client, shared_client
+):
+    odoo.handlers[("res.partner", "search_count")] = lambda domain: 7
+
+    count, fault = await async_client.multicall(MULTICALL)
+    assert count == 7
+    assert isinstance(fault, xmlrpc.client.Fault)
+    assert shared_client._multicall_supported is False
+
+    # A new session's client shares the flag and sends no second probe
+    odoo.requests.clear()
+    other = OdooAsyncClient(shared_client, async_client._http)
+    assert await other.multicall(MULTICALL[:1]) == [7]
+    assert [xmlrpc.client.loads(r.content)[1] for r in odoo.requests] == [
+        "execute_kw"
+    ]
+
+
+def _serve_partners(odoo, count):
+    """Answer res.partner search_read from count records with IDs 1..count"""
+    records = [{"id": i} for i in range(1, count + 1)]
+
+    def search_read(domain, offset=0, limit=None, order=None, fields=None):
+        return records[offset:offset + limit if limit else None]
+
+    odoo.handlers[("res.partner", "search_read")] = search_read
+
+
+async def _pages(async_client, **kwargs):
+    return [
+        [record["id"] for record in page]
+        async for page in async_client.search_read_iter("res.partner", [], **kwargs)
+    ]
+
+
+async def test_search_read_iter_pages_through_all_records(odoo, async_client):
+    _serve_partners(odoo, 1200)
+
+    pages = await _pages(async_client, page=500)
+    assert [len(page) for page in pages] == [500, 500, 200]
+    assert [id_ for page in pages for id_ in page] == list(range(1, 1201))
+    assert [(call[3]["offset"], call[3]["limit"]) for call in odoo.calls] == [
+        (0, 500), (500, 500), (1000, 500)
+    ]
+    assert {call[3]["order"] for call in odoo.calls} == {"id"}
+    assert all("fields" not in call[3] for call in odoo.calls)
+
+
+async def test_search_read_iter_stops_at_limit(odoo, async_client):
+    _serve_partners(odoo, 1200)
+
+    pages = await _pages(async_client, page=500, limit=600, fields=["name"])
+    assert [len(page) for page in pages] == [500, 100]
+    assert [call[3]["limit"] for call in odoo.calls] == [500, 100]
+    assert odoo.calls[0][3]["fields"] == ["name"]
+
+
+async def test_search_read_iter_stops_at_full_last_page(odoo, async_client):
+    _serve_partners(odoo, 1000)
+
+    assert [len(page) for page in await _pages(async_client, page=500)] == [500, 500]
+    # The third call finds nothing and ends the iteration
+    assert len(odoo.calls) == 3
+
+
+async def test_stale_disk_entries_are_refreshed_in_the_background(
+    odoo, async_client, tmp_path
+):
+    disk_cache = DiskCache("http://odoo.test", "db", tmp_path, ttl=60)
+    disk_cache.write("models", {"res.partner": {"name": "Contact"}})
+    old = time.time() - 120
+    os.utime(disk_cache._path("models"), (old, old))
+    async_client.disk_cache = disk_cache
+    odoo.handlers[("ir.model", "search")] = lambda domain: [1]
+    odoo.handlers[("ir.model", "read")] = lambda ids, fields: [
+        {"model": "res.partner", "name": "Partner"}
+    ]
+
+    # The stale copy is served at once, the refresh runs afterwards
+    assert await async_client.get_models() == {"res.partner": {"name": "Contact"}}
+    await asyncio.gather(*async_client._refresh_tasks.values())
+    assert disk_cache.read("models") == ({"res.partner": {"name": "Partner"}}, True)
@@ -0,0 +1,95 @@
+"""Tests for the metadata caches"""
+
+import os
+import time
+
+from odoo_mcp.disk_cache import DiskCache
+from odoo_mcp.odoo_client import MetadataCache
+
+
+def test_metadata_cache_returns_copies():
+    cache = MetadataCache()
+    value = {"name": "Contact"}
+    cache.set("res.partner", value)
+    value["name"] = "changed"
+
+    cached = cache.get("res.partner")
+    assert cached == {"name": "Contact"}
+    cached["fields"] = {}
+    assert cache.get("res.partner") == {"name": "Contact"}
+
+
+def test_metadata_cache_expires(monkeypatch):
+    cache = MetadataCache(ttl=10)
+    cache.set("models", [1])
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("models") is None
+
+
+def test_metadata_cache_evicts_least_recently_used():
+    cache = MetadataCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_metadata_cache_clear():
+    cache = MetadataCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.clear() == 2
+    assert cache.get("a") is None
+
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskCache("http://odoo", "db", directory=tmp_path)
+    assert cache.read("models") == (None, False)
+
+    cache.write("models", {"res.partner": {"name": "Contact"}})
+    assert cache.read("models") == ({"res.partner": {"name": "Contact"}}, True)
+
+
+def test_disk_cache_stale_entries_are_still_returned(tmp_path):
+    cache = DiskCache("http://odoo", "db", directory=tmp_path, ttl=60)
+    cache.write("models", [1])
+    old = time.time() - 120
+    os.utime(cache._path("models"), (old, old))
+    assert cache.read("models") == ([1], False)
+
+
+def test_disk_cache_is_scoped_to_the_database(tmp_path):
+    cache = DiskCache("http://odoo", "db1", directory=tmp_path)
+    cache.write("models", [1])
+    other = DiskCache("http://odoo", "db2", directory=tmp_path)
+    assert other.read("models") == (None, False)
+
+
+def test_disk_cache_keys_stay_inside_the_directory(tmp_path):
+    cache = DiskCache("http://odoo", "db", directory=tmp_path / "cache")
+    key = "fields/../../../escaped"
+    cache.write(key, [1])
+
+    assert cache._path(key).parent == cache.directory
+    assert not (tmp_path / "escaped.json").exists()
+    assert cache.read(key) == ([1], True)
+
+
+def test_disk_cache_ignores_unreadable_files(tmp_path):
+    cache = DiskCache("http://odoo", "db", directory=tmp_path)
+    cache.write("models", [1])
+    cache._path("models").write_bytes(b"{not json")
+    assert cache.read("models") == (None, False)
+
+
+def test_disk_cache_clear(tmp_path):
+    cache = DiskCache("http://odoo", "db", directory=tmp_path)
+    assert cache.clear() == 0
+    cache.write("models", [1])
+    cache.write("fields/res.partner", {})
+    assert cache.clear() == 2
+    assert cache.read("models") == (None, False)
@@ -0,0 +1,106 @@
+"""Tests for prepare_domain"""
+
+import pytest
+
+from odoo_mcp.odoo_client import prepare_domain
+
+
+def test_empty_domain():
+    assert prepare_domain([]) == []
+
+
+def test_bare_condition_is_wrapped():
+    assert prepare_domain(["name", "=", "test"]) == [["name", "=", "test"]]
+
+
+def test_tuples_and_logical_operators():
+    domain = ["|", ("name", "ilike", "a"), ("is_company", "=", True)]
+    assert prepare_domain(domain) == [
+        "|",
+        ["name", "ilike", "a"],
+        ["is_company", "=", True],
+    ]
+
+
+def test_field_and_operator_are_normalized():
+    assert prepare_domain([[" name ", " ILIKE ", "a"]]) == [["name", "ilike", "a"]]
+
+
+FIELD_TYPES = {
+    "partner_id": "many2one",
+    "tag_ids": "many2many",
+    "sequence": "integer",
+    "identification_id": "char",
+    "ref": "char",
+}
+
+
+def test_numeric_strings_become_ids():
+    domain = [
+        ["id", "in", ["1", 2, "x"]],
+        ["partner_id", "=", "7"],
+        ["tag_ids", "in", ["3"]],
+        ["sequence", "!=", "10"],
+    ]
+    assert prepare_domain(domain, field_types=FIELD_TYPES) == [
+        ["id", "in", [1, 2, "x"]],
+        ["partner_id", "=", 7],
+        ["tag_ids", "in", [3]],
+        ["sequence", "!=", 10],
+    ]
+
+
+def test_char_id_fields_keep_their_strings():
+    # hr.employee's identification_id is a Char field, "0012345" is not 12345
+    domain = [["identification_id", "=", "0012345"], ["ref", "=", "7"]]
+    assert prepare_domain(domain, field_types=FIELD_TYPES) == domain
+
+
+def test_only_id_is_coerced_without_field_types():
+    domain = [["id", "=", "7"], ["partner_id", "=", "7"]]
+    assert prepare_domain(domain) == [["id", "=", 7], ["partner_id", "=", "7"]]
+
+
+def test_numeric_strings_kept_for_other_operators():
+    domain = [["partner_id", "ilike", "7"], ["sequence", ">", "10"]]
+    assert prepare_domain(domain, field_types=FIELD_TYPES) == domain
+
+
+def test_non_decimal_digits_are_not_coerced():
+    # "²".isdigit() is true but int("²") raises
+    assert prepare_domain([["id", "=", "²"]]) == [["id", "=", "²"]]
+
+
+@pytest.mark.parametrize("leaf", [[1, "=", 1], [0, "=", 1]])
+def test_constant_leaves(leaf):
+    assert prepare_domain(["|", leaf, ["name", "=", "a"]]) == [
+        "|",
+        leaf,
+        ["name", "=", "a"],
+    ]
+
+
+@pytest.mark.parametrize(
+    "domain",
+    [
+        "name = test",
+        [["name", "contains", "a"]],
+        [["name", "="]],
+        ["&&"],
+        [[["name"], "=", "a"]],
+        [[2, "=", 1]],
+        [42],
+    ],
+)
+def test_invalid_domains(domain):
+    with pytest.raises(ValueError):
+        prepare_domain(domain)
+
+
+def test_comma_to_in():
+    domain = [["ref", "ilike", "A1, B2,"], ["name", "=", "a,b"]]
+    assert prepare_domain(domain, comma_to_in=True) == [
+        ["ref", "in", ["A1", "B2"]],
+        ["name", "=", "a,b"],
+    ]
+    assert prepare_domain(domain) == domain
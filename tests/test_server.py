@@ -0,0 +1,132 @@
+"""Tests for the server helpers and argument models"""
+
+import asyncio
+import inspect
+import logging
+import xmlrpc.client
+from typing import Any, Dict
+from urllib.parse import quote
+
+import orjson
+import pytest
+from mcp.server.fastmcp.exceptions import ToolError
+from pydantic import ValidationError
+
+from odoo_mcp import server
+from odoo_mcp.odoo_client import OdooClient
+from odoo_mcp.server import SearchReadArgs, _resolve_fields, mcp_result
+
+
+def test_mcp_result_sync():
+    @mcp_result
+    def tool(x: int) -> int:
+        return x * 2
+
+    assert tool(2) == {"success": True, "result": 4}
+    assert tool.__name__ == "tool"
+    assert inspect.signature(tool).return_annotation == Dict[str, Any]
+    assert list(inspect.signature(tool).parameters) == ["x"]
+
+
+def test_mcp_result_async():
+    @mcp_result
+    async def tool(x: int) -> int:
+        return x * 2
+
+    assert inspect.iscoroutinefunction(tool)
+    assert asyncio.run(tool(2)) == {"success": True, "result": 4}
+
+
+@pytest.mark.parametrize(
+    "error, message",
+    [
+        (ToolError("Record not found"), "Record not found"),
+        (ValueError("bad domain"), "Invalid input: bad domain"),
+        (xmlrpc.client.Fault(2, "Invalid field"), "<Fault 2: 'Invalid field'>"),
+        (RuntimeError("connection lost"), "connection lost"),
+    ],
+)
+def test_mcp_result_errors(error, message):
+    @mcp_result
+    def tool() -> None:
+        raise error
+
+    assert tool() == {"success": False, "error": message}
+
+
+def test_mcp_result_logs_only_unexpected_errors(caplog):
+    @mcp_result
+    def tool(error: Exception) -> None:
+        raise error
+
+    with caplog.at_level(logging.ERROR):
+        tool(xmlrpc.client.Fault(2, "Invalid field"))
+        tool(ToolError("Record not found"))
+        assert not caplog.records
+        tool(RuntimeError("connection lost"))
+    assert [record.exc_info[0] for record in caplog.records] == [RuntimeError]
+
+
+def test_search_read_args_domain():
+    assert SearchReadArgs(model_name="res.partner").domain == []
+    assert SearchReadArgs(model_name="res.partner", domain=None).domain == []
+
+    args = SearchReadArgs(
+        model_name="res.partner", domain='[["is_company", "=", true]]'
+    )
+    assert args.domain == [["is_company", "=", True]]
+
+    args = SearchReadArgs(model_name="res.partner", domain=["name", "=", "a"])
+    assert args.domain == [["name", "=", "a"]]
+
+
+@pytest.mark.parametrize(
+    "domain", ["not json", '{"name": "a"}', [["name", "contains", "a"]]]
+)
+def test_search_read_args_invalid_domain(domain):
+    with pytest.raises(ValidationError):
+        SearchReadArgs(model_name="res.partner", domain=domain)
+
+
+@pytest.mark.parametrize("kwargs", [{"limit": 0}, {"limit": -1}, {"offset": -1}])
+def test_search_read_args_rejects_bad_paging(kwargs):
+    with pytest.raises(ValidationError):
+        SearchReadArgs(model_name="res.partner", **kwargs)
+
+
+def test_search_read_args_paging():
+    args = SearchReadArgs(model_name="res.partner", limit=1, offset=0)
+    assert (args.limit, args.offset) == (1, 0)
+
+
+def test_resolve_fields():
+    assert _resolve_fields("res.partner", None) == [
+        "id", "name", "email", "phone", "is_company"
+    ]
+    assert _resolve_fields("x.unknown", None) == ["id", "display_name"]
+    assert _resolve_fields("res.partner", ["*"]) is None
+    assert _resolve_fields("res.partner", ["name"]) == ["name"]
+
+
+def test_search_resource_pages_with_the_sync_client(monkeypatch):
+    monkeypatch.setattr(OdooClient, "_connect", lambda self: None)
+    client = OdooClient("http://odoo.test", "db", "admin", "secret")
+    records = [{"id": i} for i in range(1, 1201)]
+    calls = []
+
+    def execute(model, method, domain, offset, limit, order):
+        calls.append((model, method, domain, offset, limit))
+        return records[offset:offset + limit]
+
+    monkeypatch.setattr(client, "_execute", execute)
+    monkeypatch.setattr(server, "_ODOO", client)
+
+    # Outside of an MCP request the resource falls back to the sync client
+    result = asyncio.run(
+        server.search_records_resource("res.partner", quote('[["id", ">", 0]]'))
+    )
+    assert orjson.loads(result) == records
+    assert calls == [
+        ("res.partner", "search_read", [["id", ">", 0]], offset, 500)
+        for offset in (0, 500, 1000)
+    ]
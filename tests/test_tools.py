@@ -0,0 +1,151 @@
+"""Tests for the MCP tools against a fake Odoo"""
+
+import types
+
+import httpx
+import pytest
+
+from odoo_mcp import server
+from odoo_mcp.disk_cache import DiskCache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def ctx(async_client):
+    """Context of a tool call in a session whose async client is async_client"""
+    lifespan_context = types.SimpleNamespace(odoo_async=async_client)
+    return types.SimpleNamespace(
+        request_context=types.SimpleNamespace(lifespan_context=lifespan_context)
+    )
+
+
+async def test_read_many_reads_in_chunks_of_500(odoo, ctx):
+    odoo.handlers[("res.partner", "read")] = lambda ids, fields=None: [
+        {"id": id_} for id_ in ids
+    ]
+    ids = list(range(1, 1201))
+
+    result = await server.read_many(ctx, "res.partner", ids, fields=["name"])
+    assert result == {"success": True, "result": [{"id": id_} for id_ in ids]}
+    assert [len(call[2][0]) for call in odoo.calls] == [500, 500, 200]
+    assert {tuple(call[3]["fields"]) for call in odoo.calls} == {("name",)}
+
+
+async def test_read_many_reports_odoo_errors(ctx):
+    result = await server.read_many(ctx, "res.partner", [1, 2])
+    assert result == {
+        "success": False,
+        "error": "<Fault 2: 'Unknown method res.partner.read'>",
+    }
+
+
+async def test_read_uses_the_default_fields(odoo, ctx):
+    odoo.handlers[("res.partner", "read")] = lambda ids, fields=None: [
+        {"id": ids[0], "fields": fields}
+    ]
+
+    result = await server.read(ctx, "res.partner", 5)
+    assert result == {
+        "success": True,
+        "result": [
+            {"id": 5, "fields": ["id", "name", "email", "phone", "is_company"]}
+        ],
+    }
+
+
+async def test_read_reports_missing_records(odoo, ctx):
+    odoo.handlers[("res.partner", "read")] = lambda ids, fields=None: []
+
+    result = await server.read(ctx, "res.partner", 5)
+    assert result == {
+        "success": False,
+        "error": "Record 5 not found in model res.partner.",
+    }
+
+
+async def test_read_reports_odoo_errors(odoo, ctx):
+    # E.g. a default field that does not exist on this Odoo version
+    result = await server.read(ctx, "res.partner", 5)
+    assert result == {
+        "success": False,
+        "error": "<Fault 2: 'Unknown method res.partner.read'>",
+    }
+
+
+async def test_search_count_reports_odoo_errors(ctx):
+    result = await server.search_count(ctx, "res.partner", [["name", "=", "a"]])
+    assert result == {
+        "success": False,
+        "error": "<Fault 2: 'Unknown method res.partner.search_count'>",
+    }
+
+
+async def test_list_models_reports_connection_errors(odoo, ctx):
+    odoo.responses.append(httpx.ConnectError("Connection refused"))
+
+    result = await server.list_models(ctx)
+    assert result == {"success": False, "error": "Connection refused"}
+
+
+async def test_model_info_reports_connection_errors(odoo, ctx, shared_client):
+    shared_client._multicall_supported = False
+    odoo.responses.extend(httpx.ConnectError("Connection refused") for _ in range(2))
+
+    result = await server.model_info(ctx, "res.partner")
+    assert result == {"success": False, "error": "Connection refused"}
+
+
+def _serve_model(odoo):
+    odoo.handlers[("ir.model", "search_read")] = lambda domain, fields: [
+        {"id": 1, "name": "Contact", "model": "res.partner"}
+    ]
+    odoo.handlers[("res.partner", "fields_get")] = lambda attributes: {
+        "name": {"type": "char", "string": "Name"}
+    }
+
+
+async def test_model_info_is_served_from_disk_while_odoo_is_down(
+    odoo, ctx, async_client, tmp_path
+):
+    async_client.disk_cache = DiskCache("http://odoo.test", "db", tmp_path)
+    _serve_model(odoo)
+    expected = {
+        "success": True,
+        "result": {
+            "id": 1,
+            "name": "Contact",
+            "model": "res.partner",
+            "fields": {"name": {"type": "char", "string": "Name"}},
+        },
+    }
+    assert await server.model_info(ctx, "res.partner") == expected
+
+    # As after a restart: nothing in memory and Odoo unreachable
+    async_client.metadata_cache.clear()
+    odoo.responses.extend(httpx.ConnectError("Connection refused") for _ in range(2))
+    assert await server.model_info(ctx, "res.partner") == expected
+    assert len(odoo.responses) == 2
+
+
+async def test_domain_ids_follow_the_cached_field_types(odoo, ctx):
+    odoo.handlers[("hr.employee", "search_count")] = lambda domain: 1
+    odoo.handlers[("ir.model", "search_read")] = lambda domain, fields: [
+        {"id": 1, "name": "Employee", "model": "hr.employee"}
+    ]
+    odoo.handlers[("hr.employee", "fields_get")] = lambda attributes: {
+        "parent_id": {"type": "many2one"},
+        "identification_id": {"type": "char"},
+    }
+    domain = [["parent_id", "=", "7"], ["identification_id", "=", "0012345"]]
+
+    # Field definitions not cached yet: only "id" would be coerced
+    await server.search_count(ctx, "hr.employee", domain)
+    await server.model_info(ctx, "hr.employee")
+    await server.search_count(ctx, "hr.employee", domain)
+
+    sent = [call[2][0] for call in odoo.calls if call[1] == "search_count"]
+    assert sent == [
+        [["parent_id", "=", "7"], ["identification_id", "=", "0012345"]],
+        [["parent_id", "=", 7], ["identification_id", "=", "0012345"]],
+    ]
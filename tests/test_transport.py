@@ -0,0 +1,68 @@
+"""Tests for the kept-alive connection of RedirectTransport"""
+
+import threading
+import xmlrpc.client
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+import pytest
+
+from odoo_mcp.odoo_client import RedirectTransport
+
+
+@pytest.fixture(autouse=True)
+def no_proxy(monkeypatch):
+    # RedirectTransport tunnels through HTTP_PROXY when it is set
+    monkeypatch.delenv("HTTP_PROXY", raising=False)
+
+
+def test_connection_is_reused_for_the_same_host():
+    transport = RedirectTransport(use_https=False)
+    connection = transport.make_connection("odoo.test")
+    assert transport.make_connection("odoo.test") is connection
+
+
+def test_connection_to_the_previous_host_is_closed(monkeypatch):
+    transport = RedirectTransport(use_https=False)
+    first = transport.make_connection("odoo.test")
+    closed = []
+    monkeypatch.setattr(first, "close", lambda: closed.append(first))
+
+    second = transport.make_connection("other.test")
+    assert second is not first
+    assert closed == [first]
+    assert transport.make_connection("other.test") is second
+
+
+@pytest.fixture
+def xmlrpc_server():
+    """Local XML-RPC server recording the client address of every request"""
+    addresses = []
+
+    class Handler(SimpleXMLRPCRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            addresses.append(self.client_address)
+            super().do_POST()
+
+    server = SimpleXMLRPCServer(
+        ("127.0.0.1", 0), requestHandler=Handler, logRequests=False
+    )
+    server.register_function(lambda: 42, "answer")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, addresses
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_share_one_connection(xmlrpc_server):
+    server, addresses = xmlrpc_server
+    host, port = server.server_address
+    proxy = xmlrpc.client.ServerProxy(
+        f"http://{host}:{port}/RPC2", transport=RedirectTransport(use_https=False)
+    )
+
+    assert [proxy.answer() for _ in range(3)] == [42, 42, 42]
+    assert len(addresses) == 3
+    assert len(set(addresses)) == 1